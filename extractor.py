@@ -1,22 +1,66 @@
 import re
-import json
-import time
 import os
+import queue
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+import orjson
+import requests
+import xxhash
+from lxml import etree, html as lxml_html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import StaleElementReferenceException
 from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+try:
+    import re2 as fastre  # linear-time engine for the multi-MB page_source scans
+except ImportError:
+    fastre = re
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 # ---------- Configuration ----------
 DEFAULT_WAIT = 12
 SCROLL_ATTEMPTS = 3
+EVENT_WAIT = 4  # cap for waits that replace fixed sleeps
+SCROLL_WAIT = 2
 NEGATIVE_REVIEW_LIMIT = 10
+MIN_REVIEW_HITS = 3  # a container selector with this many hits is taken as the working one
+BROWSER_POOL_SIZE = 2
+HTTP_TIMEOUT = 10
+# Resolved chromedriver path + the Chrome version it was resolved for
+CHROMEDRIVER_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'gm_extractor', 'chromedriver_path')
+# Serializes cold-cache installs across processes (batch workers start together)
+CHROMEDRIVER_LOCK = CHROMEDRIVER_CACHE + '.lock'
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Heavy resources we never read; blocked at the network layer to speed up page loads
+BLOCKED_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.woff*", "*.mp4", "*googleusercontent.com/gm*"]
+
+# Candidate offsets into the place array (APP_INITIALIZATION_STATE[3][6] -> [6]), in priority order
+APP_STATE_PATHS = {
+    "name": [(11,)],
+    "rating": [(4, 7)],
+    "total_reviews": [(4, 8)],
+    # [18] is "Name, street, ..." rather than a bare address; leave gaps to the DOM probe
+    "address": [(39,)],
+    "phone": [(178, 0, 0)],
+    "website": [(7, 0)],
+}
 
 # Centralize selectors to make maintenance easier
 SELECTORS = {
@@ -47,21 +91,170 @@ SELECTORS = {
     "rating_icon": 'span[role="img"][aria-label]'
 }
 
+# Rough day counts used to compare "N units ago" strings
+AGO_UNIT_DAYS = {"year": 365, "month": 30, "week": 7}
+
+# ---------- Precompiled patterns ----------
+# Embedded place payload served with the raw HTML; lets us skip rendering for metadata
+RE_APP_STATE = re.compile(r'APP_INITIALIZATION_STATE=(\[.*?\]);window\.', re.S)
+RE_REVIEW_COUNT = re.compile(r'([\d,]+)\s*review', re.I)
+RE_YEARS = re.compile(r'(\d+)\s+years?', re.I)
+RE_RATING_LINE = re.compile(r'^\d+(\.\d+)?$')
+RE_STAR = re.compile(r'(\d+)\s*star', re.I)
+RE_ADDR_PREFIX = re.compile(r'Address:\s*', re.I)
+
+# Patterns run over the whole page_source; inline flags keep them valid for both re2 and re
+FASTRE_AGO = fastre.compile(r'(?i)(\d+)\s+(year|month|week)s?\s+ago')
+FASTRE_JSONLD_SCRIPT = fastre.compile(r'(?is)<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>')
+
+# First element matching any of arguments[0] (tried in order), or null
+QS_JS = """
+for (const s of arguments[0]) {
+    const el = document.querySelector(s);
+    if (el) return el;
+}
+return null;
+"""
+
+# Reads all basic metadata in a single execute_script call. Each field is an
+# independent probe gathered with Promise.all (execute_script awaits the result).
+# arguments[0] maps field -> list of CSS selectors (tried in order).
+EXTRACT_JS = """
+const sel = arguments[0];
+const text = el => (el.innerText || el.textContent || '').trim();
+const aria = el => el.getAttribute('aria-label');
+const first = (list, pick) => {
+    for (const s of list) {
+        const el = document.querySelector(s);
+        const v = el ? pick(el) : null;
+        if (v) return v;
+    }
+    return null;
+};
+const each = (list, pick) => list.map(s => {
+    const el = document.querySelector(s);
+    return el ? pick(el) : null;
+});
+const q = probe => new Promise(r => r(probe()));
+return Promise.all([
+    q(() => first(sel.name, text)),
+    q(() => document.title),
+    q(() => first(sel.rating, el => /^\\d+(\\.\\d+)?$/.test(text(el)) ? text(el) : null)),
+    q(() => first(sel.website_link, el => el.href || null)),
+    q(() => each(sel.review_count_buttons, aria)),
+    q(() => first(sel.address_button, aria)),
+    q(() => each(sel.phone_buttons, aria)),
+]).then(([name, title, rating, website, reviews, address, phone]) => ({
+    name, title, rating, website,
+    aria: {reviews, address, phone},
+}));
+"""
+
+# Clicks every visible "More" button in one pass, then resolves after the next frame
+# so the expanded text is laid out before it is read. arguments[0] = selector list.
+EXPAND_REVIEWS_JS = """
+let clicked = 0;
+for (const s of arguments[0]) {
+    document.querySelectorAll(s).forEach(b => {
+        if (b.offsetParent === null) return;
+        try { b.click(); clicked++; } catch (e) {}
+    });
+}
+return new Promise(r => requestAnimationFrame(() => setTimeout(() => r(clicked), 80)));
+"""
+
+# Serializes rating/text/date for the first `limit` review cards in one call.
+# arguments[0] holds the selector lists, arguments[1] the limit, arguments[2] the
+# hit count at which a container selector is accepted without trying the rest.
+COLLECT_REVIEWS_JS = """
+const sel = arguments[0], limit = arguments[1], minHits = arguments[2];
+const text = el => (el.innerText || el.textContent || '').trim();
+const firstText = (root, list) => {
+    for (const s of list) {
+        const el = root.querySelector(s);
+        const t = el ? text(el) : '';
+        if (t) return t;
+    }
+    return '';
+};
+let items = [], used = null;
+for (const s of sel.containers) {
+    const found = document.querySelectorAll(s);
+    if (found.length > items.length) {
+        items = [...found];
+        used = s;
+    }
+    if (found.length >= minHits) break;
+}
+return {
+    selector: used,
+    items: items.slice(0, limit).map(el => ({
+        stars: [...el.querySelectorAll(sel.rating_icon)].map(s => s.getAttribute('aria-label') || ''),
+        text: firstText(el, sel.text),
+        date: firstText(el, sel.date),
+    })),
+};
+"""
+
 # ---------- Utility helpers ----------
-def _safe_find_text(driver, css_or_selector, by=By.CSS_SELECTOR, timeout=3) -> Optional[str]:
+def _dig(data, path):
+    for idx in path:
+        try:
+            data = data[idx]
+        except (IndexError, KeyError, TypeError):
+            return None
+    return data
+
+def _parse_app_state(html: str) -> Dict:
+    """
+    Pull basic place metadata out of the APP_INITIALIZATION_STATE blob.
+    Returns only the fields that were found with the expected type.
+    """
+    m = RE_APP_STATE.search(html or '')
+    if not m:
+        return {}
+    blob = _dig(orjson.loads(m.group(1)), (3, 6))
+    if not isinstance(blob, str):
+        return {}
+    place = _dig(orjson.loads(blob.lstrip(")]}'\n")), (6,))
+    if not isinstance(place, list):
+        return {}
+
+    expected = {
+        "name": str, "rating": (int, float), "total_reviews": int,
+        "address": str, "phone": str, "website": str,
+    }
+    found = {}
+    for field, paths in APP_STATE_PATHS.items():
+        for path in paths:
+            value = _dig(place, path)
+            if isinstance(value, expected[field]) and not isinstance(value, bool) and value != '':
+                found[field] = float(value) if field == 'rating' else value
+                break
+    return found
+
+def _wait_until(driver, condition, timeout=EVENT_WAIT) -> bool:
+    """Best-effort WebDriverWait; returns False on timeout instead of raising."""
     try:
-        if by == By.CSS_SELECTOR:
-            el = WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, css_or_selector)))
-        else:
-            el = WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, css_or_selector)))
-        txt = el.text.strip()
-        return txt if txt else None
+        WebDriverWait(driver, timeout).until(condition)
+        return True
     except:
-        return None
-
-def _safe_find_element(driver, by, selector, timeout=3):
+        return False
+
+def _wait_for_any(driver, locators, timeout=3):
+    """
+    Poll all (by, selector) candidates inside a single wait and return the
+    first match in priority order, so a missing selector doesn't burn its
+    own full timeout before the next one is tried.
+    """
+    def _probe(d):
+        for by, sel in locators:
+            elems = d.find_elements(by, sel)
+            if elems:
+                return elems[0]
+        return False
     try:
-        return WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, selector)))
+        return WebDriverWait(driver, timeout, ignored_exceptions=(StaleElementReferenceException,)).until(_probe)
     except:
         return None
 
@@ -71,10 +264,18 @@ def _attr_or_none(element, attr_name):
     except:
         return None
 
+def _jsonld_blobs(body: str) -> List[str]:
+    """Contents of <script type="application/ld+json"> tags; regex fallback if lxml can't parse."""
+    try:
+        tree = lxml_html.fromstring(body)
+        return tree.xpath("//script[@type='application/ld+json']/text()")
+    except (etree.ParserError, ValueError):
+        return FASTRE_JSONLD_SCRIPT.findall(body)
+
 def _parse_int_from_aria(aria_text: str) -> Optional[int]:
     if not aria_text:
         return None
-    m = re.search(r'([\d,]+)\s*review', aria_text, re.IGNORECASE)
+    m = RE_REVIEW_COUNT.search(aria_text)
     if m:
         return int(m.group(1).replace(',', ''))
     return None
@@ -83,19 +284,115 @@ def _parse_date_ago_text(date_str: str) -> Optional[int]:
     # Returns number of years if "X years ago" pattern found, else None
     if not date_str:
         return None
-    m = re.search(r'(\d+)\s+years?', date_str, re.IGNORECASE)
+    m = RE_YEARS.search(date_str)
     if m:
         return int(m.group(1))
     return None
 
-# ---------- Main extractor ----------
-class GoogleMapsExtractorA:
-    def __init__(self, headless: bool = True):
-        self.driver = None
-        self.wait = None
+# ---------- Browser pool ----------
+def _chrome_version() -> Optional[str]:
+    try:
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except:
+        return None
+
+@contextmanager
+def _file_lock(path):
+    """Exclusive cross-process lock held on `path` for the duration of the block."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a+b') as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK gives up after ~10s; keep waiting
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _read_cached_driver(version: Optional[str]) -> Optional[str]:
+    if not version:
+        return None
+    try:
+        with open(CHROMEDRIVER_CACHE, 'rb') as f:
+            cached = orjson.loads(f.read())
+        if cached.get('chrome_version') == version and os.path.isfile(cached.get('path') or ''):
+            return cached['path']
+    except:
+        pass
+    return None
+
+def _write_cached_driver(path: str, version: str):
+    # write-then-rename so readers never see a half-written file
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_CACHE), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(CHROMEDRIVER_CACHE), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps({'path': path, 'chrome_version': version}))
+            os.replace(tmp, CHROMEDRIVER_CACHE)
+        except:
+            os.unlink(tmp)
+            raise
+    except:
+        pass
+
+@lru_cache(maxsize=None)
+def _chromedriver_path() -> str:
+    """
+    Resolve chromedriver via webdriver-manager once and reuse the path until
+    the installed Chrome version changes, skipping the network version check.
+    """
+    version = _chrome_version()
+    cached = _read_cached_driver(version)
+    if cached:
+        return cached
+
+    # Only one process installs at a time (webdriver-manager's drivers.json isn't
+    # safe for concurrent writers); the rest pick up its result once the lock frees
+    with _file_lock(CHROMEDRIVER_LOCK):
+        cached = _read_cached_driver(version)
+        if cached:
+            return cached
+        path = ChromeDriverManager().install()
+        if version:
+            _write_cached_driver(path, version)
+    return path
+
+def _quit_driver(driver):
+    try:
+        driver.quit()
+    except:
+        pass
+
+class BrowserPool:
+    """
+    Keeps warm Chrome instances around so repeated extractions skip the
+    browser startup. Not thread-safe; use one pool per process.
+    """
+    def __init__(self, size: int = BROWSER_POOL_SIZE, headless: bool = True, prewarm: bool = True):
         self.headless = headless
+        self._idle = queue.Queue(maxsize=size)
+        if prewarm:
+            try:
+                for _ in range(size):
+                    self._idle.put_nowait(self._new_driver())
+            except:
+                # don't leak the browsers that did start
+                self.close()
+                raise
 
-    def _setup_driver(self):
+    def _new_driver(self):
         chrome_options = Options()
         if self.headless:
             chrome_options.add_argument('--headless=new')
@@ -104,21 +401,125 @@ class GoogleMapsExtractorA:
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--log-level=3')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-default-apps')
+        chrome_options.add_argument('--disable-sync')
+        chrome_options.add_argument('--metrics-recording-only')
+        chrome_options.add_argument('--mute-audio')
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false,primaryHoverType=4,availableHoverTypes=4')
+        chrome_options.add_argument('--disable-features=TranslateUI,BlinkGenPropertyTrees')
+        # driver.get() returns on DOMContentLoaded; we wait for the elements we need ourselves
+        chrome_options.page_load_strategy = 'eager'
         chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
         chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-
-        service = Service(ChromeDriverManager().install(), log_path=os.devnull)
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.wait = WebDriverWait(self.driver, DEFAULT_WAIT)
+        chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 1,
+        })
+
+        service = Service(_chromedriver_path(), log_path=os.devnull)
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except:
+            pass
+        return driver
 
-    def _close(self):
-        if self.driver:
+    def acquire(self):
+        """Hand out an idle browser, starting a new one if none is alive."""
+        while True:
             try:
-                self.driver.quit()
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return self._new_driver()
+            try:
+                driver.current_url  # cheap liveness check
+                return driver
             except:
-                pass
-            self.driver = None
+                _quit_driver(driver)
+
+    def release(self, driver):
+        """Reset the browser and keep it for the next extraction (or quit it if the pool is full)."""
+        if driver is None:
+            return
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            self._idle.put_nowait(driver)
+        except:
+            _quit_driver(driver)
+
+    def close(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            _quit_driver(driver)
+
+
+# ---------- Main extractor ----------
+class GoogleMapsExtractorA:
+    def __init__(self, headless: bool = True, pool: Optional[BrowserPool] = None):
+        self.driver = None
+        self.wait = None
+        self.headless = headless
+        # page_source snapshot; cleared whenever we click/scroll and the DOM changes
+        self._cached_source = None
+        # review container selector that worked last; layouts are stable within a session
+        self._winning_review_selector = None
+        # Without a shared pool, keep the old behaviour: one browser per call
+        self._owns_pool = pool is None
+        self.pool = pool or BrowserPool(size=1, headless=headless, prewarm=False)
+        self.http = requests.Session()
+        self.http.headers.update({'User-Agent': USER_AGENT, 'Accept-Language': 'en-US,en;q=0.9'})
+        # Runs the HTTP fetch alongside the browser load. A single worker means a
+        # fetch left over from a failed call finishes before the next one starts,
+        # so self.http is never used from two threads at once.
+        self._http_job = ThreadPoolExecutor(max_workers=1)
+
+    def close(self):
+        """Shut down the HTTP worker and every browser in the pool."""
+        self._http_job.shutdown(wait=True)
+        self.pool.close()
+
+    def _page_source(self) -> str:
+        if self._cached_source is None:
+            self._cached_source = self.driver.page_source
+        return self._cached_source
+
+    def _qs(self, selectors):
+        """
+        First element matching any of the CSS selectors, or None. A miss comes
+        back as null from the page instead of a NoSuchElementException.
+        """
+        try:
+            return self.driver.execute_script(QS_JS, list(selectors))
+        except:
+            return None
+
+    def _click(self, element):
+        self.driver.execute_script("arguments[0].click();", element)
+        self._cached_source = None
+
+    def _fetch_place_json(self, url: str):
+        """
+        Fetch the raw place HTML over plain HTTP and parse the embedded JSON.
+        Returns (fields, html); fields is empty when the payload can't be parsed.
+        """
+        try:
+            resp = self.http.get(url, timeout=HTTP_TIMEOUT, allow_redirects=True)
+            resp.raise_for_status()
+        except Exception:
+            return {}, None
+        try:
+            return _parse_app_state(resp.text), resp.text
+        except Exception:
+            return {}, resp.text
 
     def get_place_details(self, url: str) -> Dict:
         result = {
@@ -132,125 +533,137 @@ class GoogleMapsExtractorA:
             'recent_negative_reviews': []
         }
 
+        # The HTTP fetch never touches the driver, so it can overlap browser startup and page load
+        fast_future = None
         try:
+            print("→ Fetching place data over HTTP")
+            fast_future = self._http_job.submit(self._fetch_place_json, url)
+
             print("→ Starting browser")
-            self._setup_driver()
+            self.driver = self.pool.acquire()
+            self.wait = WebDriverWait(self.driver, DEFAULT_WAIT)
             print("→ Loading page")
             self.driver.get(url)
+            self._cached_source = None
+
+            # Wait for the place header instead of a fixed render delay
+            try:
+                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "h1")))
+            except:
+                pass
 
-            # Small wait for initial render
-            time.sleep(4)
+            fast, raw_html = fast_future.result()
+            result.update(fast)
+            for field in fast:
+                print(f"   ✓ {field.replace('_', ' ').capitalize()} (from HTTP): {fast[field]}")
+
+            # NAME / RATING / REVIEW COUNT / ADDRESS / PHONE / WEBSITE in one round-trip
+            try:
+                meta = self.driver.execute_script(EXTRACT_JS, {
+                    'name': SELECTORS['name'],
+                    'rating': SELECTORS['rating'],
+                    'review_count_buttons': SELECTORS['review_count_buttons'],
+                    'address_button': [SELECTORS['address_button']],
+                    'phone_buttons': SELECTORS['phone_buttons'],
+                    'website_link': [SELECTORS['website_link']],
+                }) or {}
+            except:
+                meta = {}
+            aria = meta.get('aria') or {}
 
             # NAME
-            for sel in SELECTORS['name']:
-                name = _safe_find_text(self.driver, sel, By.CSS_SELECTOR, timeout=4)
+            if not result['name']:
+                name = (meta.get('name') or '').strip()
                 if name:
                     result['name'] = name
                     print(f"   ✓ Name: {name}")
-                    break
-            if not result['name']:
-                # fallback to title
-                title = self.driver.title or ""
-                if ' - Google Maps' in title:
-                    result['name'] = title.replace(' - Google Maps', '').strip()
-                    print(f"   ✓ Name (from title): {result['name']}")
+                else:
+                    # fallback to title
+                    title = meta.get('title') or ""
+                    if ' - Google Maps' in title:
+                        result['name'] = title.replace(' - Google Maps', '').strip()
+                        print(f"   ✓ Name (from title): {result['name']}")
 
             # RATING
-            for sel in SELECTORS['rating']:
-                rating_text = _safe_find_text(self.driver, sel, By.CSS_SELECTOR, timeout=3)
-                if rating_text and re.match(r'^\d+(\.\d+)?$', rating_text.strip()):
+            if not result['rating']:
+                rating_text = (meta.get('rating') or '').strip()
+                if rating_text and RE_RATING_LINE.match(rating_text):
                     result['rating'] = float(rating_text.replace(',', '.'))
                     print(f"   ✓ Rating: {result['rating']}")
-                    break
 
             # TOTAL REVIEWS (aria-label on review button)
-            for sel in SELECTORS['review_count_buttons']:
-                try:
-                    el = self.driver.find_element(By.CSS_SELECTOR, sel)
-                    aria = _attr_or_none(el, 'aria-label')
-                    parsed = _parse_int_from_aria(aria)
+            if not result['total_reviews']:
+                for label in aria.get('reviews') or []:
+                    parsed = _parse_int_from_aria(label)
                     if parsed:
                         result['total_reviews'] = parsed
                         print(f"   ✓ Total reviews: {parsed}")
                         break
-                except:
-                    continue
 
             # ADDRESS
-            try:
-                addr_el = self.driver.find_element(By.CSS_SELECTOR, SELECTORS['address_button'])
-                aria = _attr_or_none(addr_el, 'aria-label') or ''
-                if aria:
-                    result['address'] = re.sub(r'Address:\s*', '', aria, flags=re.IGNORECASE).strip()
+            if not result['address']:
+                label = aria.get('address') or ''
+                if label:
+                    result['address'] = RE_ADDR_PREFIX.sub('', label).strip()
                     print("   ✓ Address found")
-            except:
-                pass
 
             # PHONE
-            for sel in SELECTORS['phone_buttons']:
-                try:
-                    el = self.driver.find_element(By.CSS_SELECTOR, sel)
-                    aria = _attr_or_none(el, 'aria-label') or ''
-                    if aria:
-                        phone = aria.replace('Phone:', '').replace('Copy phone number', '').strip()
-                        if phone:
-                            result['phone'] = phone
-                            print("   ✓ Phone found")
-                            break
-                except:
-                    continue
+            if not result['phone']:
+                for label in aria.get('phone') or []:
+                    if not label:
+                        continue
+                    phone = label.replace('Phone:', '').replace('Copy phone number', '').strip()
+                    if phone:
+                        result['phone'] = phone
+                        print("   ✓ Phone found")
+                        break
 
             # WEBSITE
-            try:
-                el = self.driver.find_element(By.CSS_SELECTOR, SELECTORS['website_link'])
-                href = _attr_or_none(el, 'href')
+            if not result['website']:
+                href = meta.get('website')
                 if href:
                     result['website'] = href
                     print("   ✓ Website found")
-            except:
-                pass
 
             # REVIEWS: click reviews tab if present
             print("→ Attempting to open Reviews")
             clicked = False
-            for by, sel in SELECTORS['reviews_tab_buttons']:
+            btn = _wait_for_any(self.driver, SELECTORS['reviews_tab_buttons'], timeout=6)
+            if btn:
                 try:
-                    btn = _safe_find_element(self.driver, by, sel, timeout=6)
-                    if btn:
-                        aria = _attr_or_none(btn, 'aria-label') or ''
-                        parsed = _parse_int_from_aria(aria)
-                        if parsed and result['total_reviews'] == 0:
-                            result['total_reviews'] = parsed
-                        self.driver.execute_script("arguments[0].click();", btn)
-                        clicked = True
-                        time.sleep(2)
-                        print("   ✓ Reviews tab clicked")
-                        break
+                    aria = _attr_or_none(btn, 'aria-label') or ''
+                    parsed = _parse_int_from_aria(aria)
+                    if parsed and result['total_reviews'] == 0:
+                        result['total_reviews'] = parsed
+                    self._click(btn)
+                    clicked = True
+                    _wait_until(self.driver, EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, SELECTORS['review_containers'][0])))
+                    print("   ✓ Reviews tab clicked")
                 except:
-                    continue
+                    pass
 
             if not clicked:
                 print("   i) Reviews tab not clickable / not found — continuing with what we have")
 
             # Try to sort by Lowest rating (best-effort)
             print("→ Trying to sort reviews by lowest")
-            for by, sel in SELECTORS['sort_buttons']:
-                btn = _safe_find_element(self.driver, by, sel, timeout=4)
-                if btn:
-                    try:
-                        self.driver.execute_script("arguments[0].click();", btn)
-                        time.sleep(1)
-                        # click lowest option
-                        for by2, sel2 in SELECTORS['lowest_option']:
-                            low = _safe_find_element(self.driver, by2, sel2, timeout=3)
-                            if low:
-                                self.driver.execute_script("arguments[0].click();", low)
-                                time.sleep(2)
-                                print("   ✓ Sorted by lowest")
-                                break
-                        break
-                    except:
-                        continue
+            btn = _wait_for_any(self.driver, SELECTORS['sort_buttons'], timeout=4)
+            if btn:
+                try:
+                    self._click(btn)
+                    _wait_until(self.driver, EC.visibility_of_element_located((By.CSS_SELECTOR, 'div[role="menu"]')))
+                    # click lowest option
+                    low = _wait_for_any(self.driver, SELECTORS['lowest_option'], timeout=3)
+                    if low:
+                        first = self.driver.find_elements(By.CSS_SELECTOR, SELECTORS['review_containers'][0])
+                        self._click(low)
+                        # the list is re-rendered once the new sort order arrives
+                        if first:
+                            _wait_until(self.driver, EC.staleness_of(first[0]))
+                        print("   ✓ Sorted by lowest")
+                except:
+                    pass
 
             # Extract negative reviews
             print("→ Extracting negative reviews")
@@ -259,7 +672,7 @@ class GoogleMapsExtractorA:
 
             # Find first review quick
             print("→ Determining first review date (fast method)")
-            first_date = self._find_first_review_fast()
+            first_date = self._find_first_review_fast(raw_html)
             result['first_review_date'] = first_date
 
             # If total_reviews still zero but we saw negatives, set approximate
@@ -272,7 +685,17 @@ class GoogleMapsExtractorA:
             return {"error": f"Extraction failed: {repr(e)}"}
 
         finally:
-            self._close()
+            # don't leave a fetch running past this call if we bailed out early
+            if fast_future is not None and not fast_future.cancel():
+                try:
+                    fast_future.result(timeout=HTTP_TIMEOUT)
+                except Exception:
+                    pass
+            self.pool.release(self.driver)
+            self.driver = None
+            self._cached_source = None
+            if self._owns_pool:
+                self.pool.close()
 
     def _extract_negative_reviews(self) -> List[Dict]:
         driver = self.driver
@@ -280,134 +703,114 @@ class GoogleMapsExtractorA:
         seen = set()
 
         # Find a scrollable container to load more reviews (best-effort)
-        scrollable = None
-        for sel in SELECTORS['scrollable']:
-            try:
-                scrollable = driver.find_element(By.CSS_SELECTOR, sel)
-                if scrollable:
-                    break
-            except:
-                continue
+        scrollable = self._qs(SELECTORS['scrollable'])
 
         if scrollable:
             for _ in range(SCROLL_ATTEMPTS):
                 try:
-                    driver.execute_script('arguments[0].scrollTop = arguments[0].scrollHeight', scrollable)
-                    time.sleep(1.2)
+                    old_height = driver.execute_script(
+                        'arguments[0].scrollTop = arguments[0].scrollHeight; return arguments[0].scrollHeight', scrollable)
+                    self._cached_source = None
                 except:
                     break
+                # stop as soon as scrolling no longer loads more reviews
+                grew = _wait_until(driver, lambda d: d.execute_script(
+                    'return arguments[0].scrollHeight', scrollable) != old_height, timeout=SCROLL_WAIT)
+                if not grew:
+                    break
 
-        # Collect review elements (choose selector with most hits)
-        review_elements = []
-        for sel in SELECTORS['review_containers']:
-            try:
-                elems = driver.find_elements(By.CSS_SELECTOR, sel)
-                if len(elems) > len(review_elements):
-                    review_elements = elems
-            except:
-                continue
-
-        # Limit how many we process (safety)
-        for el in review_elements[:30]:
-            try:
-                # rating: look for aria-label on star icon
-                rating = None
-                try:
-                    stars = el.find_elements(By.CSS_SELECTOR, SELECTORS['rating_icon'])
-                    for s in stars:
-                        aria = _attr_or_none(s, 'aria-label') or ''
-                        m = re.search(r'(\d+)\s*star', aria, re.IGNORECASE)
-                        if m:
-                            rating = int(m.group(1))
-                            break
-                except:
-                    rating = None
-
-                if rating is None:
-                    rating = 1  # fallback conservative
-
-                # We only want negative reviews (<=2)
-                if rating > 2:
-                    continue
+        # Expand truncated reviews before their text is read
+        try:
+            driver.execute_script(EXPAND_REVIEWS_JS, SELECTORS['expand_buttons'])
+        except:
+            pass
+        self._cached_source = None
 
-                # Expand "more" if present
-                try:
-                    for bsel in SELECTORS['expand_buttons']:
-                        btns = el.find_elements(By.CSS_SELECTOR, bsel)
-                        for b in btns:
-                            try:
-                                if b.is_displayed():
-                                    driver.execute_script("arguments[0].click();", b)
-                                    time.sleep(0.2)
-                                    break
-                            except:
-                                continue
-                except:
-                    pass
+        # Collect rating/text/date for all review cards in one round-trip,
+        # trying the selector that worked last time first
+        containers = SELECTORS['review_containers']
+        if self._winning_review_selector:
+            containers = [self._winning_review_selector] + [c for c in containers if c != self._winning_review_selector]
+        try:
+            collected = driver.execute_script(COLLECT_REVIEWS_JS, {
+                'containers': containers,
+                'rating_icon': SELECTORS['rating_icon'],
+                'text': SELECTORS['review_text'],
+                'date': SELECTORS['review_date'],
+            }, 30, MIN_REVIEW_HITS) or {}
+        except:
+            collected = {}
+        items = collected.get('items') or []
+        if len(items) >= MIN_REVIEW_HITS:
+            self._winning_review_selector = collected.get('selector')
+
+        for item in items:
+            # rating: look for aria-label on star icon
+            rating = None
+            for aria in item.get('stars') or []:
+                m = RE_STAR.search(aria)
+                if m:
+                    rating = int(m.group(1))
+                    break
 
-                # Extract text
-                text = None
-                for tsel in SELECTORS['review_text']:
-                    try:
-                        t = el.find_element(By.CSS_SELECTOR, tsel).text.strip()
-                        if t:
-                            text = t
-                            break
-                    except:
-                        continue
+            if rating is None:
+                rating = 1  # fallback conservative
 
-                # Extract date text (human readable like '3 years ago')
-                date_text = None
-                for dsel in SELECTORS['review_date']:
-                    try:
-                        d = el.find_element(By.CSS_SELECTOR, dsel).text.strip()
-                        if d:
-                            date_text = d
-                            break
-                    except:
-                        continue
+            # We only want negative reviews (<=2)
+            if rating > 2:
+                continue
 
-                if not text or len(text) < 15:
-                    continue
+            text = item.get('text')
+            # human readable like '3 years ago'
+            date_text = item.get('date')
 
-                # dedupe
-                h = (text[:80], rating)
-                if h in seen:
-                    continue
-                seen.add(h)
-
-                negatives.append({
-                    "text": text,
-                    "rating": rating,
-                    "date": date_text or "Recent"
-                })
-                print(f"   ✓ Negative review #{len(negatives)} (rating={rating})")
-                if len(negatives) >= NEGATIVE_REVIEW_LIMIT:
-                    break
+            if not text or len(text) < 15:
+                continue
 
-            except Exception:
+            # dedupe on a hash of the full text, with the rating folded into the top byte
+            h = xxhash.xxh3_64_intdigest(text) ^ (rating << 56)
+            if h in seen:
                 continue
+            seen.add(h)
+
+            negatives.append({
+                "text": text,
+                "rating": rating,
+                "date": date_text or "Recent"
+            })
+            print(f"   ✓ Negative review #{len(negatives)} (rating={rating})")
+            if len(negatives) >= NEGATIVE_REVIEW_LIMIT:
+                break
 
         print(f"   → Extracted {len(negatives)} negative reviews")
         return negatives
 
-    def _find_first_review_fast(self) -> Optional[str]:
+    def _find_first_review_fast(self, raw_html: Optional[str] = None) -> Optional[str]:
         """
         Attempt multiple fast methods:
-         1) JSON-LD metadata (datePublished)
+         1) JSON-LD metadata (datePublished), in page_source then raw_html
          2) regex searching in page_source for 'X years/months/weeks ago'
          3) visible date elements
          Fallback: "Several years ago"
         """
         driver = self.driver
 
+        # Serialize the DOM once and share it between the JSON-LD and regex passes
+        try:
+            src = self._page_source()
+        except:
+            src = ''
+
         # 1) JSON-LD
         try:
-            src = driver.page_source
-            json_ld_matches = re.findall(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', src, re.DOTALL | re.IGNORECASE)
+            sources = [src]
+            if raw_html:
+                sources.append(raw_html)
+            # lazy, so raw_html is only parsed if page_source had no usable datePublished
+            json_ld_matches = (raw for body in sources for raw in _jsonld_blobs(body))
             for raw in json_ld_matches:
                 try:
-                    data = json.loads(raw.strip())
+                    data = orjson.loads(raw.strip())
                     if isinstance(data, dict) and 'review' in data:
                         reviews = data['review'] if isinstance(data['review'], list) else [data['review']]
                         dates = []
@@ -436,20 +839,20 @@ class GoogleMapsExtractorA:
 
         # 2) regex on page source
         try:
-            src = driver.page_source
-            years = re.findall(r'(\d+)\s+years?\s+ago', src, re.IGNORECASE)
-            months = re.findall(r'(\d+)\s+months?\s+ago', src, re.IGNORECASE)
-            weeks = re.findall(r'(\d+)\s+weeks?\s+ago', src, re.IGNORECASE)
-
-            if years:
-                maxy = max(int(x) for x in years)
-                return f"{maxy} year{'s' if maxy>1 else ''} ago"
-            if months:
-                m = max(int(x) for x in months)
-                return f"{m} month{'s' if m>1 else ''} ago"
-            if weeks:
-                w = max(int(x) for x in weeks)
-                return f"{w} week{'s' if w>1 else ''} ago"
+            # single pass over all "N years/months/weeks ago" hits, keeping the oldest
+            oldest = None
+            oldest_days = 0
+            for num, unit in FASTRE_AGO.findall(src):
+                n = int(num)
+                unit = unit.lower()
+                days = n * AGO_UNIT_DAYS[unit]
+                if days > oldest_days:
+                    oldest_days = days
+                    oldest = (n, unit)
+
+            if oldest:
+                n, unit = oldest
+                return f"{n} {unit}{'s' if n>1 else ''} ago"
         except:
             pass
 
@@ -499,6 +902,6 @@ if __name__ == "__main__":
     print("=================================\n")
 
     # If you want to debug full output, uncomment below:
-    # print(json.dumps(data, indent=2, ensure_ascii=False))
+    # print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
 
 
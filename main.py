@@ -1,13 +1,35 @@
 #!/usr/bin/env python3
 """
 Simple Google Maps Data Extractor
-Just run this file and input the URL when prompted
+Just run this file and input the URL when prompted,
+or pass a file of URLs / a comma-separated list to extract them in parallel:
+
+    python main.py urls.txt
+    python main.py "https://maps.google.com/...,https://maps.google.com/..."
 """
 
+import argparse
 import json
+import multiprocessing
+import os
+import re
 import sys
+import time
+from collections import OrderedDict
 from datetime import datetime
-from extractor import GoogleMapsExtractor
+from multiprocessing.util import Finalize
+from extractor import BrowserPool, GoogleMapsExtractorA
+
+MAX_WORKERS = 8
+URL_RE = re.compile(r'(?:google\.com/maps|maps\.google\.com|goo\.gl/maps)', re.I)
+CACHE_SIZE = 128
+CACHE_TTL = 3600  # seconds
+
+# url -> (timestamp, JSON-encoded results); decoded on every hit so callers get a fresh copy
+_result_cache = OrderedDict()
+
+# Per-process extractor used by batch workers
+_extractor = None
 
 def print_separator(char="-", length=60):
     """Print a separator line"""
@@ -22,8 +44,7 @@ def print_header():
 
 def validate_url(url):
     """Check if URL is a valid Google Maps URL"""
-    valid_patterns = ['google.com/maps', 'maps.google.com', 'goo.gl/maps']
-    return any(pattern in url.lower() for pattern in valid_patterns)
+    return bool(URL_RE.search(url))
 
 def display_results(data):
     """Display extraction results in a formatted way"""
@@ -71,6 +92,25 @@ def display_results(data):
     
     print("\n" + "=" * 60)
 
+def extract_cached(extractor, url, use_cache=True):
+    """Extract a URL, reusing a result from the last hour if it was already extracted"""
+    if use_cache:
+        hit = _result_cache.get(url)
+        if hit and time.time() - hit[0] < CACHE_TTL:
+            _result_cache.move_to_end(url)
+            print("♻️  Using cached result for this URL")
+            return json.loads(hit[1])
+
+    results = extractor.get_place_details(url)
+
+    # Failed extractions are not cached so they can be retried
+    if use_cache and 'error' not in results:
+        _result_cache[url] = (time.time(), json.dumps(results, sort_keys=True))
+        _result_cache.move_to_end(url)
+        while len(_result_cache) > CACHE_SIZE:
+            _result_cache.popitem(last=False)
+    return results
+
 def save_to_file(data, url):
     """Save results to a JSON file"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -91,11 +131,81 @@ def save_to_file(data, url):
         print(f"\n❌ Failed to save file: {str(e)}")
         return False
 
+def load_urls(source):
+    """Read URLs from a file (one per line) or a comma-separated list"""
+    if os.path.isfile(source):
+        with open(source, encoding='utf-8') as f:
+            candidates = f.read().splitlines()
+    else:
+        # Maps URLs carry commas in @lat,lng,zoom, so only split where a new URL starts
+        candidates = re.split(r',\s*(?=https?://)', source)
+    # Drop blanks and duplicates, keep order
+    return list(dict.fromkeys(u.strip() for u in candidates if u.strip()))
+
+def _init_worker():
+    """Give each worker process one long-lived browser"""
+    global _extractor
+    # Only the parent prints per-URL results; extractor progress from up to
+    # MAX_WORKERS processes would interleave with them
+    sys.stdout = open(os.devnull, 'w')
+    # Chrome starts lazily on the first acquire() inside get_place_details, so a
+    # failed launch comes back as an error result instead of a crashing initializer
+    # (which multiprocessing.Pool would respawn forever)
+    _extractor = GoogleMapsExtractorA(pool=BrowserPool(size=1, prewarm=False))
+    # Runs when the worker exits cleanly (pool.close + join)
+    Finalize(None, _extractor.close, exitpriority=10)
+
+def _worker_extract(url):
+    return url, _extractor.get_place_details(url)
+
+def run_batch(urls):
+    """Extract many URLs in parallel, one Chrome per worker process"""
+    valid = []
+    for url in urls:
+        if validate_url(url):
+            valid.append(url)
+        else:
+            print(f"❌ Skipping invalid URL: {url}")
+
+    if not valid:
+        print("\n❌ No valid Google Maps URLs to extract.")
+        return
+
+    processes = min(multiprocessing.cpu_count(), MAX_WORKERS, len(valid))
+    print(f"\n⏳ Extracting {len(valid)} URL(s) with {processes} worker(s)...\n")
+
+    with multiprocessing.Pool(processes=processes, initializer=_init_worker) as pool:
+        for url, results in pool.imap_unordered(_worker_extract, valid):
+            print(f"\n🔗 {url}")
+            display_results(results)
+        # Let workers exit normally so their browsers are shut down
+        pool.close()
+        pool.join()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Google Maps business data extractor")
+    parser.add_argument('urls', nargs='?',
+                        help="file with one URL per line, or a comma-separated list of URLs (batch mode)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always re-extract, even if the URL was extracted in the last hour")
+    return parser.parse_args()
+
 def main():
     """Main function"""
+    args = parse_args()
+    extractor = None
     try:
         # Print header
         print_header()
+
+        if args.urls:
+            run_batch(load_urls(args.urls))
+            return
+
+        # Interactive mode runs one extraction at a time, so a single browser is enough.
+        # It starts on the first URL, inside get_place_details, so a failed launch is
+        # reported as that URL's error and the prompt keeps going.
+        extractor = GoogleMapsExtractorA(pool=BrowserPool(size=1, prewarm=False))
         
         # Keep running until user decides to exit
         while True:
@@ -122,8 +232,7 @@ def main():
             print("\n⏳ Extracting data from Google Maps...")
             print("This may take a few seconds...\n")
             
-            extractor = GoogleMapsExtractor()
-            results = extractor.get_place_details(url)
+            results = extract_cached(extractor, url, use_cache=not args.no_cache)
             
             # Display results
             display_results(results)
@@ -151,6 +260,9 @@ def main():
     except Exception as e:
         print(f"\n❌ Unexpected error: {str(e)}")
         sys.exit(1)
+    finally:
+        if extractor:
+            extractor.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,72 @@
+import json
+import unittest
+
+try:
+    import extractor
+except ImportError:  # selenium / webdriver-manager etc. not installed
+    extractor = None
+
+
+def _app_state_html(place, prefix=")]}'\n"):
+    """Wrap a place array the way Maps embeds it: APP_INITIALIZATION_STATE[3][6] -> [6]."""
+    inner = prefix + json.dumps([None] * 6 + [place])
+    state = [None, None, None, [None] * 6 + [inner]]
+    return f"<script>window.APP_INITIALIZATION_STATE={json.dumps(state)};window.APP_FLAGS=[];</script>"
+
+
+def _place(overrides=None):
+    place = [None] * 200
+    place[11] = "Joe's Pizza"
+    place[4] = [None] * 9
+    place[4][7] = 4.5
+    place[4][8] = 1234
+    place[39] = "7 Carmine St, New York, NY 10014"
+    place[178] = [["(212) 366-1182"]]
+    place[7] = ["https://www.joespizzanyc.com/"]
+    for idx, value in (overrides or {}).items():
+        place[idx] = value
+    return place
+
+
+@unittest.skipUnless(extractor, "extractor dependencies not installed")
+class ParseAppStateTest(unittest.TestCase):
+    def test_all_fields(self):
+        self.assertEqual(extractor._parse_app_state(_app_state_html(_place())), {
+            'name': "Joe's Pizza",
+            'rating': 4.5,
+            'total_reviews': 1234,
+            'address': "7 Carmine St, New York, NY 10014",
+            'phone': "(212) 366-1182",
+            'website': "https://www.joespizzanyc.com/",
+        })
+
+    def test_wrong_type_is_skipped(self):
+        found = extractor._parse_app_state(_app_state_html(_place({11: 42, 39: ""})))
+        self.assertNotIn('name', found)
+        self.assertNotIn('address', found)
+        self.assertEqual(found['total_reviews'], 1234)
+
+    def test_integer_rating_becomes_float(self):
+        place = _place()
+        place[4][7] = 4
+        found = extractor._parse_app_state(_app_state_html(place))
+        self.assertIsInstance(found['rating'], float)
+
+    def test_xssi_prefix_is_optional(self):
+        with_prefix = extractor._parse_app_state(_app_state_html(_place()))
+        without = extractor._parse_app_state(_app_state_html(_place(), prefix=""))
+        self.assertEqual(with_prefix, without)
+        self.assertEqual(with_prefix['name'], "Joe's Pizza")
+
+    def test_no_payload(self):
+        self.assertEqual(extractor._parse_app_state("<html><body>nothing here</body></html>"), {})
+        self.assertEqual(extractor._parse_app_state(None), {})
+
+    def test_dig_missing_path(self):
+        self.assertIsNone(extractor._dig([1, [2]], (1, 5)))
+        self.assertIsNone(extractor._dig([1, None], (1, 0)))
+        self.assertEqual(extractor._dig([1, [2, [3]]], (1, 1, 0)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
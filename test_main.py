@@ -0,0 +1,22 @@
+import importlib.util
+import unittest
+
+# main imports the Selenium-based extractor
+HAS_SELENIUM = importlib.util.find_spec("selenium") is not None
+
+
+@unittest.skipUnless(HAS_SELENIUM, "selenium not installed")
+class LoadUrlsTest(unittest.TestCase):
+    def test_keeps_commas_inside_map_urls(self):
+        from main import load_urls
+
+        url = "https://www.google.com/maps/place/Joe's+Pizza/@40.7305,-73.9892,17z/data=!3m1!4b1"
+        other = "https://maps.google.com/?cid=123"
+
+        self.assertEqual(load_urls(url), [url])
+        self.assertEqual(load_urls(f"{url},{other}"), [url, other])
+        self.assertEqual(load_urls(f"{url}, {other}, {url}"), [url, other])
+
+
+if __name__ == "__main__":
+    unittest.main()